@@ -5,27 +5,29 @@ Ejecuta queries en múltiples instancias de Splunk Cloud de forma paralela.
 """
 
 import argparse
-import json
+import asyncio
 import csv
 import logging
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
 import yaml
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import aiohttp
+import ijson
+import orjson
+from tenacity import RetryCallState, retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
-try:
-    import splunklib.client as client
-    import splunklib.results as results
-except ImportError:
-    print("Error: splunk-sdk no está instalado. Ejecuta: pip install splunk-sdk")
-    sys.exit(1)
+# uvloop es opcional y no existe en Windows; sin él se usa el event loop estándar
+uvloop = None
+if sys.platform != 'win32':
+    try:
+        import uvloop
+    except ImportError:
+        pass
 
 # Configuración de logging
 logging.basicConfig(
@@ -36,7 +38,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SplunkInstance:
     """Configuración de una instancia de Splunk"""
     name: str
@@ -50,6 +52,17 @@ class SplunkInstance:
     owner: str
 
 
+@lru_cache(maxsize=32)
+def _build_row_extractor(keys: Tuple[str, ...]) -> Callable[[Dict], Tuple]:
+    """Genera una función que devuelve los valores de `keys` de una fila como tupla ('' si falta)"""
+    # Todas las filas de una query comparten esquema: se genera el código una vez por
+    # conjunto de columnas para evitar el bucle de lookups por celda
+    fields = ''.join(f"get({key!r}, ''), " for key in keys)
+    namespace = {}
+    exec(f"def extract(row):\n    get = row.get\n    return ({fields})", namespace)
+    return namespace['extract']
+
+
 class TableRenderer:
     """Renderiza tablas en consola sin dependencias externas"""
     
@@ -68,17 +81,20 @@ class TableRenderer:
         if not columns:
             return "No hay columnas para mostrar.\n"
         
-        # Calcular anchos de columna
-        col_widths = {col: len(col) for col in columns}
-        for row in display_data:
-            for col in columns:
-                val = str(row.get(col, ''))
-                col_widths[col] = max(col_widths[col], len(val))
+        # Convertir cada celda a texto una sola vez
+        extract = _build_row_extractor(tuple(columns))
+        str_rows = [list(map(str, extract(row))) for row in display_data]
+        
+        # Calcular anchos de columna (lista paralela a columns): una reducción
+        # max(map(len, ...)) por columna en lugar de comparar celda a celda
+        col_widths = [
+            max(len(col), max(map(len, cells)))
+            for col, cells in zip(columns, zip(*str_rows))
+        ]
         
         # Limitar ancho máximo por columna
         max_width = 50
-        for col in col_widths:
-            col_widths[col] = min(col_widths[col], max_width)
+        col_widths = [min(width, max_width) for width in col_widths]
         
         # Construir tabla
         output = []
@@ -90,25 +106,19 @@ class TableRenderer:
             output.append(f"{'=' * 80}")
         
         # Separador superior
-        separator = "+" + "+".join("-" * (col_widths[col] + 2) for col in columns) + "+"
+        separator = "+" + "+".join("-" * (width + 2) for width in col_widths) + "+"
         output.append(separator)
         
         # Encabezados
-        header = "|"
-        for col in columns:
-            header += f" {col:<{col_widths[col]}} |"
-        output.append(header)
+        output.append("| " + " | ".join(col.ljust(width) for col, width in zip(columns, col_widths)) + " |")
         output.append(separator)
         
         # Filas de datos
-        for row in display_data:
-            row_str = "|"
-            for col in columns:
-                val = str(row.get(col, ''))
-                if len(val) > col_widths[col]:
-                    val = val[:col_widths[col]-3] + "..."
-                row_str += f" {val:<{col_widths[col]}} |"
-            output.append(row_str)
+        for cells in str_rows:
+            output.append("| " + " | ".join(
+                (val if len(val) <= width else val[:width-3] + "...").ljust(width)
+                for val, width in zip(cells, col_widths)
+            ) + " |")
         
         # Separador inferior
         output.append(separator)
@@ -122,25 +132,70 @@ class TableRenderer:
         return "\n".join(output)
 
 
+# Códigos HTTP transitorios que justifican reintentar una petición
+RETRY_STATUS_CODES = {500, 502, 503, 504}
+
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """Indica si un error es transitorio (conexión, respuesta cortada, timeout o 5xx); nunca de autenticación"""
+    if isinstance(exc, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError)):
+        return True
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status in RETRY_STATUS_CODES
+    return False
+
+
+def _is_connect_error(exc: BaseException) -> bool:
+    """Indica si la petición falló al conectar, es decir, sin llegar a enviarse"""
+    return isinstance(exc, aiohttp.ClientConnectorError)
+
+
+def _log_retry(retry_state: RetryCallState):
+    """Registra cada reintento con el nombre de la instancia"""
+    instance = next(arg for arg in retry_state.args if isinstance(arg, SplunkInstance))
+    exc = retry_state.outcome.exception()
+    logger.warning(
+        f"[{instance.name}] Reintento {retry_state.attempt_number} tras error transitorio: "
+        f"{str(exc) or type(exc).__name__}"
+    )
+
+
+def _retry_policy(predicate: Callable[[BaseException], bool]):
+    """Backoff exponencial con jitter: una instancia inestable no retrasa al resto del gather"""
+    return retry(
+        stop=stop_after_attempt(4),
+        wait=wait_exponential_jitter(initial=1, max=10),
+        retry=retry_if_exception(predicate),
+        before_sleep=_log_retry,
+        reraise=True
+    )
+
+
+# Peticiones idempotentes (GET): se reintentan ante cualquier error transitorio
+_retry_transient = _retry_policy(_is_transient_error)
+
+# Creación del job (POST, no idempotente): solo si no llegó a enviarse, para no duplicar jobs
+_retry_connect = _retry_policy(_is_connect_error)
+
+
 class SplunkQueryExecutor:
     """Ejecuta queries en instancias de Splunk"""
     
+    # Backoff exponencial al consultar el estado de los jobs (segundos)
+    POLL_INITIAL_BACKOFF = 0.25
+    POLL_MAX_BACKOFF = 5.0
+    
+    # Filas por página al descargar resultados (límite maxresultrows por defecto de Splunk)
+    RESULTS_PAGE_SIZE = 50000
+    
+    # Páginas descargadas a la vez por instancia (igual a limit_per_host del conector)
+    RESULTS_CONCURRENT_PAGES = 4
+    
+    # Respuestas hasta este tamaño se parsean de una vez con orjson; mayores, en streaming con ijson
+    ORJSON_MAX_BYTES = 4 * 1024 * 1024
+    
     def __init__(self, timeout: int = 300):
         self.timeout = timeout
-        self.session = self._create_session()
-    
-    def _create_session(self) -> requests.Session:
-        """Crea sesión HTTP con reintentos"""
-        session = requests.Session()
-        retry = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[500, 502, 503, 504]
-        )
-        adapter = HTTPAdapter(max_retries=retry)
-        session.mount('http://', adapter)
-        session.mount('https://', adapter)
-        return session
     
     def normalize_query(self, query: str) -> str:
         """Normaliza la query para Splunk"""
@@ -149,121 +204,214 @@ class SplunkQueryExecutor:
             query = f"search {query}"
         return query
     
-    def execute_splunk_sdk(self, instance: SplunkInstance, query: str) -> Tuple[List[Dict], Optional[str]]:
-        """Ejecuta query usando Splunk SDK"""
-        try:
-            # Preparar token
+    def _auth_headers(self, instance: SplunkInstance) -> Dict[str, str]:
+        """Construye las cabeceras de autenticación según el tipo de token"""
+        if instance.auth_type == 'splunk':
             token_value = instance.token
-            if instance.auth_type == 'splunk' and not token_value.startswith('Splunk '):
+            if not token_value.startswith('Splunk '):
                 token_value = f"Splunk {token_value}"
-            
-            # Crear servicio
-            service = client.connect(
-                host=instance.host,
-                port=instance.port,
-                scheme=instance.scheme,
-                token=token_value,
-                app=instance.app,
-                owner=instance.owner,
-                verify=instance.verify
-            )
-            
-            logger.info(f"[{instance.name}] Ejecutando query con SDK...")
-            
-            # Ejecutar búsqueda
-            job = service.jobs.create(
-                query,
-                exec_mode="blocking",
-                earliest_time="-24h",
-                latest_time="now"
-            )
-            
-            # Obtener resultados
-            result_stream = job.results(output_mode='json', count=0)
-            reader = results.JSONResultsReader(result_stream)
-            
-            data = []
-            for result in reader:
-                if isinstance(result, dict):
-                    data.append(result)
-            
-            logger.info(f"[{instance.name}] ✓ Completado: {len(data)} resultados")
-            return data, None
-            
-        except Exception as e:
-            error_msg = f"Error SDK: {str(e)}"
-            logger.error(f"[{instance.name}] {error_msg}")
-            return [], error_msg
+        else:
+            token_value = f"Bearer {instance.token}"
+        return {
+            'Authorization': token_value,
+            'Content-Type': 'application/x-www-form-urlencoded'
+        }
     
-    def execute_bearer_rest(self, instance: SplunkInstance, query: str) -> Tuple[List[Dict], Optional[str]]:
-        """Ejecuta query usando REST API con Bearer token"""
+    def _jobs_url(self, instance: SplunkInstance) -> str:
+        """URL del endpoint de jobs de búsqueda"""
+        base_url = f"{instance.scheme}://{instance.host}:{instance.port}"
+        if instance.auth_type == 'splunk':
+            # Mismo namespace app/owner que usaba el SDK para los tokens Splunk
+            return f"{base_url}/servicesNS/{instance.owner}/{instance.app}/search/jobs"
+        return f"{base_url}/services/search/jobs"
+    
+    def _parse_in_memory(self, response_headers) -> bool:
+        """Indica si la respuesta es lo bastante pequeña (Content-Length conocido) para orjson"""
+        content_length = response_headers.get('Content-Length')
+        return content_length is not None and int(content_length) <= self.ORJSON_MAX_BYTES
+    
+    def _job_finished(self, content: Dict[str, Any]) -> bool:
+        """Indica si el job terminó; lanza error si Splunk lo marcó como fallido"""
+        dispatch_state = content.get('dispatchState')
+        if dispatch_state == 'FAILED':
+            messages = '; '.join(m.get('text', '') for m in content.get('messages', []) if isinstance(m, dict))
+            raise RuntimeError(f"El job falló en Splunk: {messages or dispatch_state}")
+        return dispatch_state == 'DONE'
+    
+    async def _cancel_job_async(self, session: aiohttp.ClientSession, instance: SplunkInstance,
+                                job_url: str, headers: Dict[str, str]):
+        """Cancela y elimina un job en Splunk para no dejarlo consumiendo recursos"""
         try:
-            base_url = f"{instance.scheme}://{instance.host}:{instance.port}"
-            headers = {
-                'Authorization': f"Bearer {instance.token}",
-                'Content-Type': 'application/x-www-form-urlencoded'
-            }
-            
-            logger.info(f"[{instance.name}] Ejecutando query con REST API...")
-            
-            # Crear job de búsqueda
-            create_job_url = f"{base_url}/services/search/jobs"
-            data = {
-                'search': query,
-                'exec_mode': 'blocking',
-                'earliest_time': '-24h',
-                'latest_time': 'now',
-                'output_mode': 'json'
-            }
-            
-            response = self.session.post(
-                create_job_url,
+            async with session.delete(
+                job_url,
                 headers=headers,
-                data=data,
-                verify=instance.verify,
-                timeout=self.timeout
-            )
+                ssl=instance.verify,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                response.raise_for_status()
+            logger.info(f"[{instance.name}] Job cancelado: {job_url}")
+        except Exception as e:
+            logger.warning(f"[{instance.name}] No se pudo cancelar el job {job_url}: {str(e) or type(e).__name__}")
+    
+    @_retry_connect
+    async def _create_job_async(self, session: aiohttp.ClientSession, instance: SplunkInstance,
+                                create_job_url: str, headers: Dict[str, str], query: str) -> str:
+        """Crea el job de búsqueda y devuelve su SID (se reintenta solo si no se pudo conectar)"""
+        data = {
+            'search': query,
+            'exec_mode': 'normal',
+            'earliest_time': '-24h',
+            'latest_time': 'now',
+            'output_mode': 'json'
+        }
+        
+        async with session.post(
+            create_job_url,
+            headers=headers,
+            data=data,
+            ssl=instance.verify
+        ) as response:
             response.raise_for_status()
+            job_info = orjson.loads(await response.read())
+        
+        sid = job_info.get('sid')
+        if not sid:
+            raise ValueError("No se pudo obtener SID del job")
+        return sid
+    
+    @_retry_transient
+    async def _get_job_status_async(self, session: aiohttp.ClientSession, instance: SplunkInstance,
+                                    job_url: str, headers: Dict[str, str]) -> Dict[str, Any]:
+        """Consulta el estado actual del job"""
+        async with session.get(
+            job_url,
+            headers=headers,
+            params={'output_mode': 'json'},
+            ssl=instance.verify
+        ) as response:
+            response.raise_for_status()
+            job_status = orjson.loads(await response.read())
+        return job_status['entry'][0]['content']
+    
+    async def _wait_for_job_async(self, session: aiohttp.ClientSession, instance: SplunkInstance,
+                                  job_url: str, headers: Dict[str, str]) -> Dict[str, Any]:
+        """Espera a que el job termine consultando su estado con backoff exponencial"""
+        backoff = self.POLL_INITIAL_BACKOFF
+        while True:
+            await asyncio.sleep(backoff)
+            content = await self._get_job_status_async(session, instance, job_url, headers)
+            if self._job_finished(content):
+                return content
+            backoff = min(backoff * 2, self.POLL_MAX_BACKOFF)
+    
+    @_retry_transient
+    async def _fetch_results_chunk_async(self, session: aiohttp.ClientSession, instance: SplunkInstance,
+                                         results_url: str, headers: Dict[str, str], offset: int, count: int,
+                                         data: List[Optional[Dict]]) -> int:
+        """Descarga hasta `count` resultados en data[offset:], devuelve las filas escritas"""
+        params = {'output_mode': 'json', 'count': count, 'offset': offset}
+        
+        # Parsear resultados con orjson o, si son grandes, en streaming a medida que llegan los chunks
+        async with session.get(
+            results_url,
+            headers=headers,
+            params=params,
+            ssl=instance.verify
+        ) as response:
+            response.raise_for_status()
+            if self._parse_in_memory(response.headers):
+                rows = orjson.loads(await response.read()).get('results', [])
+                data[offset:offset + len(rows)] = rows
+                return len(rows)
             
-            # Obtener SID del job
-            job_info = response.json()
-            sid = job_info.get('sid')
-            
-            if not sid:
-                raise ValueError("No se pudo obtener SID del job")
-            
-            # Obtener resultados
-            results_url = f"{base_url}/services/search/jobs/{sid}/results"
-            params = {'output_mode': 'json', 'count': 0}
+            i = offset
+            async for rec in ijson.items_async(response.content, 'results.item', use_float=True):
+                data[i] = rec
+                i += 1
+        return i - offset
+    
+    async def _fetch_results_page_async(self, session: aiohttp.ClientSession, instance: SplunkInstance,
+                                        results_url: str, headers: Dict[str, str], offset: int,
+                                        data: List[Optional[Dict]], page_semaphore: asyncio.Semaphore) -> int:
+        """Descarga una página completa de resultados en data[offset:], devuelve las filas escritas"""
+        # Si Splunk devuelve menos filas de las pedidas (maxresultrows < RESULTS_PAGE_SIZE),
+        # se sigue pidiendo desde donde terminó hasta completar el rango de la página
+        end = min(offset + self.RESULTS_PAGE_SIZE, len(data))
+        position = offset
+        while position < end:
+            # Las peticiones esperan aquí y no en la cola del conector, donde correría su timeout
+            async with page_semaphore:
+                rows = await self._fetch_results_chunk_async(
+                    session, instance, results_url, headers, position, end - position, data
+                )
+            if not rows:
+                break
+            position += rows
+        return position - offset
+    
+    async def _run_search_async(self, session: aiohttp.ClientSession, instance: SplunkInstance,
+                                query: str) -> List[Dict]:
+        """Crea el job, espera a que termine y descarga sus resultados (sin capturar errores)"""
+        headers = self._auth_headers(instance)
+        
+        # Crear job de búsqueda
+        create_job_url = self._jobs_url(instance)
+        sid = await self._create_job_async(session, instance, create_job_url, headers, query)
+        job_url = f"{create_job_url}/{sid}"
+        
+        try:
+            # Esperar a que termine el job
+            job_content = await self._wait_for_job_async(session, instance, job_url, headers)
             
-            response = self.session.get(
-                results_url,
-                headers=headers,
-                params=params,
-                verify=instance.verify,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
+            # Obtener resultados en páginas descargadas de forma concurrente
+            results_url = f"{job_url}/results"
+            result_count = int(job_content.get('resultCount', 0))
+            offsets = range(0, result_count, self.RESULTS_PAGE_SIZE)
             
-            results_data = response.json()
-            data = results_data.get('results', [])
+            # Lista pre-dimensionada: cada página escribe en su rango sin listas intermedias
+            data = [None] * result_count
+            page_semaphore = asyncio.Semaphore(self.RESULTS_CONCURRENT_PAGES)
+            written = await asyncio.gather(*[
+                self._fetch_results_page_async(session, instance, results_url, headers, offset, data, page_semaphore)
+                for offset in offsets
+            ])
+            received = sum(written)
+            if received != result_count:
+                raise RuntimeError(f"Splunk devolvió {received} de {result_count} resultados")
+            return data
+        
+        except BaseException:
+            # Error definitivo o deadline agotado (CancelledError): no dejar el job corriendo en Splunk
+            await self._cancel_job_async(session, instance, job_url, headers)
+            raise
+    
+    async def execute_rest_async(self, session: aiohttp.ClientSession, instance: SplunkInstance,
+                                 query: str) -> Tuple[List[Dict], Optional[str]]:
+        """Ejecuta query usando REST API sobre una sesión aiohttp compartida"""
+        try:
+            logger.info(f"[{instance.name}] Ejecutando query con REST API (async)...")
+            # --timeout acota la ejecución completa de la instancia, reintentos incluidos
+            data = await asyncio.wait_for(self._run_search_async(session, instance, query), timeout=self.timeout)
             
             logger.info(f"[{instance.name}] ✓ Completado: {len(data)} resultados")
             return data, None
             
+        except asyncio.TimeoutError:
+            error_msg = f"Error REST: tiempo agotado (límite por instancia: {self.timeout} segundos)"
+            logger.error(f"[{instance.name}] {error_msg}")
+            return [], error_msg
         except Exception as e:
-            error_msg = f"Error REST: {str(e)}"
+            error_msg = f"Error REST: {str(e) or type(e).__name__}"
             logger.error(f"[{instance.name}] {error_msg}")
             return [], error_msg
     
-    def execute(self, instance: SplunkInstance, query: str) -> Tuple[List[Dict], Optional[str]]:
-        """Ejecuta query en una instancia"""
+    async def execute_async(self, session: aiohttp.ClientSession, instance: SplunkInstance,
+                            query: str) -> Tuple[List[Dict], Optional[str]]:
+        """Ejecuta query en una instancia desde el event loop"""
         normalized_query = self.normalize_query(query)
         
-        if instance.auth_type == 'splunk':
-            return self.execute_splunk_sdk(instance, normalized_query)
-        elif instance.auth_type == 'bearer':
-            return self.execute_bearer_rest(instance, normalized_query)
+        if instance.auth_type in ('splunk', 'bearer'):
+            return await self.execute_rest_async(session, instance, normalized_query)
         else:
             error_msg = f"Tipo de autenticación no soportado: {instance.auth_type}"
             logger.error(f"[{instance.name}] {error_msg}")
@@ -308,8 +456,15 @@ class ResultsHandler:
     @staticmethod
     def save_json(data: List[Dict], filepath: Path):
         """Guarda resultados en JSON"""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    
+    @staticmethod
+    def save_ndjson(data: List[Dict], filepath: Path):
+        """Guarda resultados en JSON Lines (un objeto por línea)"""
+        with open(filepath, 'wb') as f:
+            for row in data:
+                f.write(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE))
     
     @staticmethod
     def save_csv(data: List[Dict], filepath: Path):
@@ -320,11 +475,13 @@ class ResultsHandler:
                 f.write('')
             return
         
-        keys = list(data[0].keys())
+        # Splunk omite los campos nulos en cada fila: la cabecera es la unión ordenada de todas las claves
+        keys = tuple(dict.fromkeys(key for row in data for key in row))
         with open(filepath, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
-            writer.writeheader()
-            writer.writerows(data)
+            writer = csv.writer(f)
+            writer.writerow(keys)
+            # Filas como tuplas generadas al vuelo: evita el dict-a-lista de DictWriter
+            writer.writerows(map(_build_row_extractor(keys), data))
 
 
 def select_clients_interactive(instances: List[SplunkInstance]) -> List[str]:
@@ -363,9 +520,10 @@ def main():
     parser.add_argument('--ask-clients', action='store_true', help='Modo interactivo para seleccionar clientes')
     parser.add_argument('--parallel', type=int, default=8, help='Número de ejecuciones paralelas (default: 8)')
     parser.add_argument('--timeout', type=int, default=300, help='Timeout en segundos por instancia (default: 300)')
-    parser.add_argument('--format', choices=['json', 'csv'], default='json', help='Formato de salida (default: json)')
+    parser.add_argument('--format', choices=['json', 'ndjson', 'csv'], default='json', help='Formato de salida (default: json)')
     parser.add_argument('--outdir', default='output', help='Directorio de salida (default: output)')
-    parser.add_argument('--preview', type=int, default=20, help='Filas a mostrar en consola (default: 20)')
+    parser.add_argument('--preview', type=int, default=20, help='Filas a mostrar en consola, 0 para no mostrar (default: 20)')
+    parser.add_argument('--no-save', action='store_true', help='No guardar resultados en disco')
     
     args = parser.parse_args()
     
@@ -398,7 +556,8 @@ def main():
     else:
         selected_clients = [inst.name for inst in instances]
     
-    filtered_instances = [inst for inst in instances if inst.name in selected_clients]
+    selected_set = set(selected_clients)
+    filtered_instances = [inst for inst in instances if inst.name in selected_set]
     
     if not filtered_instances:
         logger.error("No se encontraron instancias con los clientes seleccionados")
@@ -408,7 +567,8 @@ def main():
     
     # Crear directorio de salida
     outdir = Path(args.outdir)
-    outdir.mkdir(parents=True, exist_ok=True)
+    if not args.no_save:
+        outdir.mkdir(parents=True, exist_ok=True)
     
     # Ejecutar queries en paralelo
     executor = SplunkQueryExecutor(timeout=args.timeout)
@@ -420,41 +580,69 @@ def main():
     
     start_time = time.time()
     
-    with ThreadPoolExecutor(max_workers=args.parallel) as pool:
-        futures = {
-            pool.submit(executor.execute, inst, query): inst 
-            for inst in filtered_instances
-        }
-        
-        for future in as_completed(futures):
-            instance = futures[future]
-            try:
-                data, error = future.result()
+    async def run_instance(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                           instance: SplunkInstance):
+        try:
+            async with semaphore:
+                data, error = await executor.execute_async(session, instance, query)
+            
+            if error:
+                errors[instance.name] = error
+            else:
+                results[instance.name] = data
                 
-                if error:
-                    errors[instance.name] = error
-                else:
-                    results[instance.name] = data
-                    
-                    # Guardar resultados
-                    ext = 'json' if args.format == 'json' else 'csv'
-                    filepath = outdir / f"{instance.name}.{ext}"
+                # Guardar resultados en un hilo para no bloquear el event loop
+                if not args.no_save:
+                    filepath = outdir / f"{instance.name}.{args.format}"
                     
                     if args.format == 'json':
-                        handler.save_json(data, filepath)
+                        await asyncio.to_thread(handler.save_json, data, filepath)
+                    elif args.format == 'ndjson':
+                        await asyncio.to_thread(handler.save_ndjson, data, filepath)
                     else:
-                        handler.save_csv(data, filepath)
+                        await asyncio.to_thread(handler.save_csv, data, filepath)
                     
                     logger.info(f"[{instance.name}] Guardado en {filepath}")
-                    
-                    # Mostrar preview en consola
+                
+                # Mostrar preview en consola
+                if args.preview > 0:
                     table = renderer.render(data, max_rows=args.preview, title=f"Cliente: {instance.name}")
                     print(f"\n{table}")
-                
-            except Exception as e:
-                error_msg = f"Error inesperado: {str(e)}"
-                errors[instance.name] = error_msg
-                logger.error(f"[{instance.name}] {error_msg}")
+            
+        except Exception as e:
+            error_msg = f"Error inesperado: {str(e)}"
+            errors[instance.name] = error_msg
+            logger.error(f"[{instance.name}] {error_msg}")
+    
+    async def run_all():
+        # Un único event loop multiplexa todas las conexiones; el semáforo limita la concurrencia
+        semaphore = asyncio.Semaphore(args.parallel)
+        # Sesión única para toda la ejecución: conserva conexiones keep-alive y caché DNS
+        # por host para reintentos y páginas. El pool admite todas las páginas simultáneas de
+        # las --parallel instancias, para que ninguna espere conexiones de otro tenant mientras
+        # corre su --timeout; limit_per_host acota las descargas paralelas por instancia
+        connector = aiohttp.TCPConnector(
+            limit=args.parallel * SplunkQueryExecutor.RESULTS_CONCURRENT_PAGES,
+            limit_per_host=SplunkQueryExecutor.RESULTS_CONCURRENT_PAGES,
+            ttl_dns_cache=300
+        )
+        # Sin timeout total por petición: su reloj corre mientras espera conexión libre.
+        # El límite de tiempo por instancia lo aplica execute_rest_async con --timeout
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=120)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            await asyncio.gather(*[
+                run_instance(session, semaphore, inst)
+                for inst in filtered_instances
+            ])
+    
+    if uvloop is None:
+        asyncio.run(run_all())
+    elif hasattr(uvloop, 'run'):
+        uvloop.run(run_all())
+    else:
+        # uvloop < 0.18 no tiene run(): se instala como política del event loop
+        uvloop.install()
+        asyncio.run(run_all())
     
     elapsed_time = time.time() - start_time
     
@@ -476,7 +664,8 @@ def main():
         for name, error in errors.items():
             print(f"  - {name}: {error}")
     
-    print(f"\nResultados guardados en: {outdir.absolute()}")
+    if not args.no_save:
+        print(f"\nResultados guardados en: {outdir.absolute()}")
     print("=" * 80)
     
     sys.exit(0 if not errors else 1)